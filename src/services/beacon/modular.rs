@@ -35,8 +35,9 @@ const Q96: U256 = U256::from_limbs([0, 0x1_0000_0000, 0, 0]);
 
 /// Convert a WAD-scaled u128 to Q96-scaled U256.
 /// On-chain beacon indices use Q96 fixed-point representation.
+/// Scaling by Q96 is a 96-bit shift; a u128 shifted by 96 fits in U256.
 fn wad_to_q96(wad_value: u128) -> U256 {
-    U256::from(wad_value) * Q96 / U256::from(WAD)
+    (U256::from(wad_value) << 96usize) / U256::from(WAD)
 }
 
 /// Result of a modular beacon creation
@@ -1333,4 +1334,11 @@ mod tests {
         let back = wad_to_q96(v.to::<u128>()) * U256::from(WAD) / Q96;
         assert!(v - back <= U256::from(1u64));
     }
+
+    #[test]
+    fn test_wad_to_q96_matches_multiply() {
+        for v in [0u128, 1, WAD / 3, 64_800_000_000_000_000_000, u128::MAX] {
+            assert_eq!(wad_to_q96(v), U256::from(v) * Q96 / U256::from(WAD));
+        }
+    }
 }
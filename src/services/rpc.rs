@@ -1,12 +1,24 @@
 use alloy::network::EthereumWallet;
 use alloy::primitives::Address;
 use alloy::providers::ProviderBuilder;
+use alloy::rpc::client::{ClientBuilder, RpcClient};
 use alloy::signers::{Signer, local::PrivateKeySigner};
+use alloy::transports::http::reqwest;
 use std::env;
+use std::sync::LazyLock;
 
 // Import provider types from lib.rs
 use crate::{AlloyProvider, ReadOnlyProvider};
 
+/// HTTP client shared by every RPC provider built in this process.
+///
+/// Providers are built per request (each wraps the signer of the wallet
+/// acquired for that request). `connect_http` would give each one a fresh
+/// `reqwest::Client`, i.e. a new connection pool and a new TCP+TLS handshake
+/// to the RPC endpoint on every request; sharing one client keeps those
+/// connections alive across requests.
+static RPC_HTTP_CLIENT: LazyLock<reqwest::Client> = LazyLock::new(reqwest::Client::new);
+
 /// Configuration for RPC endpoints
 #[derive(Debug, Clone)]
 pub struct RpcConfig {
@@ -42,6 +54,15 @@ impl RpcConfig {
         Ok(Self { env_type, rpc_url })
     }
 
+    /// Build an RPC client for `url` on the shared HTTP connection pool
+    pub fn http_client(url: &str) -> Result<RpcClient, String> {
+        let parsed = url
+            .parse::<reqwest::Url>()
+            .map_err(|e| format!("Invalid RPC URL '{url}': {e}"))?;
+
+        Ok(ClientBuilder::default().http_with_client(RPC_HTTP_CLIENT.clone(), parsed))
+    }
+
     /// Helper function to build a provider from a URL and private key
     fn build_provider_from_url(
         private_key: &str,
@@ -55,20 +76,16 @@ impl RpcConfig {
 
         let wallet = EthereumWallet::from(signer);
 
-        let provider = ProviderBuilder::new().wallet(wallet).connect_http(
-            url.parse()
-                .map_err(|e| format!("Invalid RPC URL '{url}': {e}"))?,
-        );
+        let provider = ProviderBuilder::new()
+            .wallet(wallet)
+            .connect_client(Self::http_client(url)?);
 
         Ok(provider)
     }
 
     /// Build a read-only provider from a URL (no wallet, for queries only)
     pub fn build_read_only_provider(url: &str) -> Result<ReadOnlyProvider, String> {
-        let provider = ProviderBuilder::new().connect_http(
-            url.parse()
-                .map_err(|e| format!("Invalid RPC URL '{url}': {e}"))?,
-        );
+        let provider = ProviderBuilder::new().connect_client(Self::http_client(url)?);
 
         Ok(provider)
     }
@@ -250,6 +267,18 @@ mod tests {
         assert!(result.is_ok());
     }
 
+    #[test]
+    fn test_http_client_valid_url() {
+        assert!(RpcConfig::http_client("http://localhost:8545").is_ok());
+    }
+
+    #[test]
+    fn test_http_client_invalid_url() {
+        let result = RpcConfig::http_client("not-a-valid-url");
+        assert!(result.is_err());
+        assert!(result.unwrap_err().contains("Invalid RPC URL"));
+    }
+
     #[test]
     fn test_build_provider_valid() {
         let config = create_test_config("mainnet", "http://localhost:8545");
@@ -19,6 +19,7 @@ use alloy::signers::{Error as SignerError, Signature, Signer};
 
 use crate::AlloyProvider;
 use crate::models::wallet::{WalletInfo, WalletManagerConfig};
+use crate::services::rpc::RpcConfig;
 use crate::services::wallet::sync::WalletSyncService;
 
 /// A gas-payer pool signer: either a local private key (dev/CI) or an AWS KMS
@@ -129,11 +130,9 @@ impl WalletHandle {
     pub fn build_provider(&self, rpc_url: &str) -> Result<AlloyProvider, String> {
         let wallet = self.signer.0.ethereum_wallet();
 
-        let provider = ProviderBuilder::new().wallet(wallet).connect_http(
-            rpc_url
-                .parse()
-                .map_err(|e| format!("Invalid RPC URL '{rpc_url}': {e}"))?,
-        );
+        let provider = ProviderBuilder::new()
+            .wallet(wallet)
+            .connect_client(RpcConfig::http_client(rpc_url)?);
 
         Ok(provider)
     }
@@ -13,6 +13,7 @@ use std::sync::{Arc, RwLock};
 
 use crate::AlloyProvider;
 use crate::models::wallet::{WalletInfo, WalletStatus};
+use crate::services::rpc::RpcConfig;
 
 /// Mock wallet pool for testing
 #[derive(Debug, Clone, Default)]
@@ -168,11 +169,9 @@ impl MockWalletHandle {
     pub fn build_provider(&self, rpc_url: &str) -> Result<AlloyProvider, String> {
         let wallet = EthereumWallet::from(self.signer.clone());
 
-        let provider = ProviderBuilder::new().wallet(wallet).connect_http(
-            rpc_url
-                .parse()
-                .map_err(|e| format!("Invalid RPC URL '{rpc_url}': {e}"))?,
-        );
+        let provider = ProviderBuilder::new()
+            .wallet(wallet)
+            .connect_client(RpcConfig::http_client(rpc_url)?);
 
         Ok(provider)
     }